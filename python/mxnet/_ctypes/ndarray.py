@@ -8,7 +8,7 @@ import sys as _sys
 import numpy as np
 
 from ..base import _LIB
-from ..base import c_array, py_str, c_str, mx_uint
+from ..base import c_array, py_str, c_str, c_str_array, mx_uint
 from ..base import NDArrayHandle, OpHandle
 from ..base import check_call
 from ..ndarray_doc import _build_doc
@@ -127,8 +127,8 @@ def _make_ndarray_function(handle, name):
             ctypes.byref(num_output),
             ctypes.byref(output_vars),
             ctypes.c_int(len(kwargs)),
-            c_array(ctypes.c_char_p, [c_str(key) for key in kwargs.keys()]),
-            c_array(ctypes.c_char_p, [c_str(str(i)) for i in kwargs.values()])))
+            c_str_array(list(kwargs.keys())),
+            c_str_array([str(i) for i in kwargs.values()])))
         if original_output is not None:
             return original_output
         if num_output.value == 1:
@@ -5,17 +5,31 @@ from __future__ import absolute_import as _abs
 
 import ctypes
 import sys
+import threading
 import numpy as _numpy
 from ..base import _LIB
-from ..base import c_array, c_str, mx_uint, py_str
+from ..base import c_str, c_str_array, c_handle_array, mx_uint, py_str
 from ..base import SymbolHandle, OpHandle
-from ..base import check_call
+from ..base import check_call, _install_lazy_functions
 from ..symbol_doc import _build_doc
 from ..name import NameManager
 from ..attribute import AttrScope
 
 _symbol_cls = None
 
+# Positional compose with a handful of inputs (e.g. binary operators) is the
+# common case, so each thread keeps handle arrays of those sizes around.
+_SMALL_ARRAY_SIZE = 4
+_small_handle_arrs = threading.local()
+
+def _borrow_handle_array(num):
+    """Get the preallocated handle array of length num for the current thread."""
+    arrs = getattr(_small_handle_arrs, 'arrs', None)
+    if arrs is None:
+        arrs = [(SymbolHandle * k)() for k in range(_SMALL_ARRAY_SIZE + 1)]
+        _small_handle_arrs.arrs = arrs
+    return arrs[num]
+
 class SymbolBase(object):
     """Symbol is symbolic graph."""
     __slots__ = ["handle"]
@@ -67,11 +81,22 @@ class SymbolBase(object):
 
         num_args = len(args) + len(kwargs)
         if len(kwargs) != 0:
-            keys = c_array(ctypes.c_char_p, [c_str(key) for key in kwargs.keys()])
-            args = c_array(SymbolHandle, [s.handle for s in kwargs.values()])
+            keys = c_str_array(list(kwargs.keys()))
+            args = c_handle_array(list(kwargs.values()))
+        elif num_args <= _SMALL_ARRAY_SIZE:
+            keys = None
+            handles = _borrow_handle_array(num_args)
+            for i, arg in enumerate(args):
+                handles[i] = arg.handle
+            try:
+                check_call(_LIB.NNSymbolCompose(
+                    self.handle, name, num_args, keys, handles))
+            finally:
+                handles[:] = [None] * num_args
+            return
         else:
             keys = None
-            args = c_array(SymbolHandle, [s.handle for s in args])
+            args = c_handle_array(args)
         check_call(_LIB.NNSymbolCompose(
             self.handle, name, num_args, keys, args))
 
@@ -83,10 +108,8 @@ class SymbolBase(object):
         **kwargs
             The attributes to set
         """
-        keys = c_array(ctypes.c_char_p,
-                       [c_str(key) for key in kwargs.keys()])
-        vals = c_array(ctypes.c_char_p,
-                       [c_str(str(val)) for val in kwargs.values()])
+        keys = c_str_array(list(kwargs.keys()))
+        vals = c_str_array([str(val) for val in kwargs.values()])
         num_args = mx_uint(len(kwargs))
         check_call(_LIB.MXSymbolSetAttrs(
             self.handle, num_args, keys, vals))
@@ -135,6 +158,7 @@ def _make_atomic_symbol_function(handle, name):
                          [py_str(arg_descs[i]) for i in range(narg)],
                          key_var_num_args,
                          ret_type)
+    hint = func_name.lower()
 
     def creator(*args, **kwargs):
         """Activation Operator of Neural Net.
@@ -161,32 +185,30 @@ def _make_atomic_symbol_function(handle, name):
             kwargs['dtype'] = _numpy.dtype(kwargs['dtype']).name
 
         if key_var_num_args and key_var_num_args not in kwargs:
-            param_keys.append(c_str(key_var_num_args))
-            param_vals.append(c_str(str(len(args))))
+            param_keys.append(key_var_num_args)
+            param_vals.append(str(len(args)))
 
         for k, v in kwargs.items():
             if isinstance(v, SymbolBase):
                 symbol_kwargs[k] = v
             else:
-                param_keys.append(c_str(k))
-                param_vals.append(c_str(str(v)))
+                param_keys.append(k)
+                param_vals.append(str(v))
+        if len(args) != 0 and len(symbol_kwargs) != 0:
+            raise TypeError(
+                '%s can only accept input'
+                'Symbols either as positional or keyword arguments, not both' % func_name)
         # create atomic symbol
-        param_keys = c_array(ctypes.c_char_p, param_keys)
-        param_vals = c_array(ctypes.c_char_p, param_vals)
+        param_keys = c_str_array(param_keys)
+        param_vals = c_str_array(param_vals)
         sym_handle = SymbolHandle()
         check_call(_LIB.MXSymbolCreateAtomicSymbol(
             handle,
             mx_uint(len(param_keys)),
             param_keys, param_vals,
             ctypes.byref(sym_handle)))
-
-        if len(args) != 0 and len(symbol_kwargs) != 0:
-            raise TypeError(
-                '%s can only accept input'
-                'Symbols either as positional or keyword arguments, not both' % func_name)
         s = _symbol_cls(sym_handle)
 
-        hint = func_name.lower()
         name = NameManager.current.get(name, hint)
         s._compose(*args, name=name, **symbol_kwargs)
         return s
@@ -197,6 +219,13 @@ def _make_atomic_symbol_function(handle, name):
     return creator
 
 
+def _get_atomic_symbol_function(name):
+    """Create the atomic symbol function of the operator with given name."""
+    hdl = OpHandle()
+    check_call(_LIB.NNGetOpHandle(c_str(name), ctypes.byref(hdl)))
+    return _make_atomic_symbol_function(hdl, name)
+
+
 def _init_symbol_module(symbol_class, root_namespace):
     """List and add all the atomic symbol functions to current module."""
     _set_symbol_class(symbol_class)
@@ -211,10 +240,17 @@ def _init_symbol_module(symbol_class, root_namespace):
 
     module_obj = sys.modules["%s.symbol" % root_namespace]
     module_internal = sys.modules["%s._symbol_internal" % root_namespace]
+    if sys.version_info >= (3, 7):
+        # only build the functions of the operators that actually get used
+        _install_lazy_functions(module_obj,
+                                [x for x in op_names if not x.startswith('_')],
+                                _get_atomic_symbol_function)
+        _install_lazy_functions(module_internal,
+                                [x for x in op_names if x.startswith('_')],
+                                _get_atomic_symbol_function)
+        return
     for name in op_names:
-        hdl = OpHandle()
-        check_call(_LIB.NNGetOpHandle(c_str(name), ctypes.byref(hdl)))
-        function = _make_atomic_symbol_function(hdl, name)
+        function = _get_atomic_symbol_function(name)
         if function.__name__.startswith('_'):
             setattr(module_internal, function.__name__, function)
         else:
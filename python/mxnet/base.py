@@ -4,6 +4,7 @@
 from __future__ import absolute_import
 
 import sys
+import array
 import ctypes
 import atexit
 import numpy as np
@@ -105,6 +106,42 @@ else:
         """
         return ctypes.c_char_p(string.encode('utf-8'))
 
+if sys.version_info[0] < 3:
+    def c_str_array(strings):
+        """Create ctypes const char ** from a list of python strings
+
+        Parameters
+        ----------
+        strings : list of string
+            python strings
+
+        Returns
+        -------
+        arr : (ctypes.c_char_p * len(strings))
+            A char pointer array that can be passed to C API
+        """
+        arr = (ctypes.c_char_p * len(strings))()
+        arr[:] = strings
+        return arr
+else:
+    def c_str_array(strings):
+        """Create ctypes const char ** from a list of python strings
+
+        Parameters
+        ----------
+        strings : list of string
+            python strings
+
+        Returns
+        -------
+        arr : (ctypes.c_char_p * len(strings))
+            A char pointer array that can be passed to C API
+        """
+        arr = (ctypes.c_char_p * len(strings))()
+        # the array keeps references to the encoded bytes
+        arr[:] = [s.encode('utf-8') for s in strings]
+        return arr
+
 
 def c_array(ctype, values):
     """Create ctypes array from a python array
@@ -124,6 +161,44 @@ def c_array(ctype, values):
     """
     return (ctype * len(values))(*values)
 
+def _pointer_typecode():
+    """Get the array.array typecode whose item size equals a C pointer."""
+    for code in ('L', 'Q'):
+        try:
+            if array.array(code).itemsize == ctypes.sizeof(ctypes.c_void_p):
+                return code
+        except ValueError:
+            # 'Q' is not available in python2
+            continue
+    return None
+
+_POINTER_TYPECODE = _pointer_typecode()
+# Below this many handles, plain ctypes array construction is faster.
+_HANDLE_MEMMOVE_THRESHOLD = 16
+
+def c_handle_array(objs):
+    """Create ctypes void * array from a list of objects that carry handles
+
+    Large lists are packed with a single memmove of the raw pointer values.
+
+    Parameters
+    ----------
+    objs : list of NDArray or Symbol
+        objects whose handle fields are packed into the array
+
+    Returns
+    -------
+    arr : (ctypes.c_void_p * len(objs))
+        A handle array that can be passed to C API
+    """
+    if len(objs) < _HANDLE_MEMMOVE_THRESHOLD or _POINTER_TYPECODE is None:
+        return c_array(ctypes.c_void_p, [o.handle for o in objs])
+    # copy the raw pointer values in one go instead of per element
+    arr = (ctypes.c_void_p * len(objs))()
+    vals = array.array(_POINTER_TYPECODE, [o.handle.value for o in objs])
+    ctypes.memmove(arr, vals.buffer_info()[0], ctypes.sizeof(arr))
+    return arr
+
 def ctypes2buffer(cptr, length):
     """Convert ctypes pointer to buffer type.
 
@@ -211,6 +286,37 @@ def build_param_doc(arg_names, arg_types, arg_descs, remove_dup=True):
     return doc_str
 
 
+def _install_lazy_functions(module, names, make_function):
+    """Create the functions of a module on first access instead of eagerly.
+
+    This relies on module level __getattr__ (PEP 562), which is only
+    available from python 3.7 on.
+
+    Parameters
+    ----------
+    module : module
+        The module the functions belong to.
+
+    names : list of str
+        Names of the functions to be created lazily.
+
+    make_function : function
+        Creates the function given its name.
+    """
+    names = frozenset(names)
+    def __getattr__(name):
+        if name not in names:
+            raise AttributeError("module '%s' has no attribute '%s'" % (module.__name__, name))
+        function = make_function(name)
+        # later lookups find the function without going through __getattr__
+        setattr(module, name, function)
+        return function
+    def __dir__():
+        return sorted(names.union(module.__dict__))
+    module.__getattr__ = __getattr__
+    module.__dir__ = __dir__
+
+
 def _notify_shutdown():
     """Notify MXNet about a shutdown."""
     check_call(_LIB.MXNotifyShutdown())
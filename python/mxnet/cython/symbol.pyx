@@ -8,6 +8,7 @@ from numbers import Number as _Number
 from ..name import NameManager
 from ..attribute import AttrScope
 from ..symbol_doc import _build_doc
+from ..base import _install_lazy_functions
 
 include "./base.pyi"
 
@@ -39,6 +40,50 @@ cdef class SymbolBase:
     def __dealloc__(self):
         CALL(NNSymbolFree(self.chandle))
 
+    def _compose(self, *args, **kwargs):
+        """Compose symbol on inputs.
+
+        This call mutates the current symbol.
+
+        Parameters
+        ----------
+        args:
+            provide positional arguments
+
+        kwargs:
+            provide keyword arguments
+        """
+        cdef vector[string] ssymbol_keys
+        cdef vector[SymbolHandle] symbol_args
+        cdef const char* c_name = NULL
+
+        name = kwargs.pop("name", None)
+        if name:
+            name = c_str(name)
+            c_name = name
+        if len(args) != 0 and len(kwargs) != 0:
+            raise TypeError("compose only accept input Symbols\
+                either as positional or keyword arguments, not both")
+
+        for k, v in kwargs.items():
+            if not isinstance(v, SymbolBase):
+                raise TypeError('Compose expect `Symbol` as arguments')
+            ssymbol_keys.push_back(c_str(k))
+            symbol_args.push_back((<SymbolBase>v).chandle)
+        for v in args:
+            if not isinstance(v, SymbolBase):
+                raise TypeError('Compose expect `Symbol` as arguments')
+            symbol_args.push_back((<SymbolBase>v).chandle)
+
+        cdef vector[const char*] symbol_keys = SVec2Ptr(ssymbol_keys)
+
+        CALL(NNSymbolCompose(
+            self.chandle,
+            c_name,
+            <nn_uint>symbol_args.size(),
+            CBeginPtr(symbol_keys),
+            &symbol_args[0] if symbol_args.size() != 0 else NULL))
+
     def _set_attr(self, **kwargs):
         """Set the attribute of the symbol.
 
@@ -107,6 +152,8 @@ cdef _make_atomic_symbol_function(OpHandle handle, string name):
                          py_str(return_type) if return_type != NULL else '')
 
     func_hint = func_name.lower()
+    # encoded once here rather than on every call
+    key_vargs_bytes = c_str(key_vargs) if key_vargs else None
 
     def creator(*args, **kwargs):
         cdef vector[string] sparam_keys
@@ -118,9 +165,9 @@ cdef _make_atomic_symbol_function(OpHandle handle, string name):
         kwargs.update(AttrScope.current.get(attr))
         name = kwargs.pop("name", None)
 
-        if key_vargs:
+        if key_vargs_bytes is not None:
             if key_vargs not in kwargs:
-                sparam_keys.push_back(c_str(key_vargs))
+                sparam_keys.push_back(key_vargs_bytes)
                 sparam_vals.push_back(c_str(str(len(args))))
 
         if len(kwargs) != 0:
@@ -178,6 +225,14 @@ cdef _make_atomic_symbol_function(OpHandle handle, string name):
     return creator
 
 
+def _get_atomic_symbol_function(name):
+    """Create the atomic symbol function of the operator with given name."""
+    cdef string sname = c_str(name)
+    cdef OpHandle handle
+    CALL(NNGetOpHandle(sname.c_str(), &handle))
+    return _make_atomic_symbol_function(handle, sname)
+
+
 def _init_symbol_module(symbol_class, root_namespace):
     """List and add all the atomic symbol functions to current module."""
     cdef const char** op_name_ptrs
@@ -192,6 +247,16 @@ def _init_symbol_module(symbol_class, root_namespace):
 
     module_obj = _sys.modules["%s.symbol" % root_namespace]
     module_internal = _sys.modules["%s._symbol_internal" % root_namespace]
+    if _sys.version_info >= (3, 7):
+        # only build the functions of the operators that actually get used
+        names = [py_str(op_names[i].c_str()) for i in range(op_names.size())]
+        _install_lazy_functions(module_obj,
+                                [x for x in names if not x.startswith('_')],
+                                _get_atomic_symbol_function)
+        _install_lazy_functions(module_internal,
+                                [x for x in names if x.startswith('_')],
+                                _get_atomic_symbol_function)
+        return
     for i in range(op_names.size()):
         CALL(NNGetOpHandle(op_names[i].c_str(), &handle))
         function = _make_atomic_symbol_function(handle, op_names[i])
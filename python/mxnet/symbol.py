@@ -4,7 +4,9 @@
 """Symbolic configuration API of mxnet."""
 from __future__ import absolute_import as _abs
 
+import array
 import ctypes
+from collections import OrderedDict
 from numbers import Number
 
 import os as _os
@@ -12,7 +14,8 @@ import sys as _sys
 import numpy as _numpy
 
 from .base import _LIB, numeric_types
-from .base import c_array, c_str, mx_uint, py_str, string_types, mx_real_t
+from .base import c_array, c_str, c_str_array, c_handle_array, mx_uint, py_str
+from .base import string_types, mx_real_t
 from .base import NDArrayHandle, ExecutorHandle, SymbolHandle
 from .base import check_call, MXNetError
 from .context import Context
@@ -35,12 +38,60 @@ except ImportError:
         raise ImportError("Cython Module cannot be loaded but MXNET_ENFORCE_CYTHON=1")
     from ._ctypes.symbol import SymbolBase, _init_symbol_module
 
+# Version of the graphs built in this process. Nodes can be shared between
+# symbols, so an in-place mutation through one symbol may change another;
+# cached metadata is only valid for the version it was read at.
+_graph_version = 0
+
+
+def _bump_graph_version():
+    """Invalidate the cached metadata of every symbol."""
+    global _graph_version  # pylint: disable=global-statement
+    _graph_version += 1
+
+# Maximum number of memoized shape/type inference results kept per symbol.
+_INFER_CACHE_SIZE = 32
+# Maximum number of executors kept per symbol by simple_bind(reuse_executor=True).
+_EXECUTOR_CACHE_SIZE = 4
+
+
+def _decode_shapes(size, ndim, data):
+    """Convert the shape arrays returned by the C API into a list of tuples."""
+    return [tuple(data[i][:n]) for i, n in enumerate(ndim[:size])]
+
 
 class Symbol(SymbolBase):
     """Symbol is symbolic graph of the mxnet."""
     # disable dictionary storage, also do not have parent type.
     # pylint: disable=no-member
-    __slots__ = []
+    __slots__ = ['_arg_names', '_output_names', '_aux_names', '_infer_cache',
+                 '_executor_cache', '_cache_version']
+
+    def __init__(self, handle):
+        """Initialize the symbol with handle
+
+        Parameters
+        ----------
+        handle : SymbolHandle
+            the handle to the underlying C++ Symbol
+        """
+        super(Symbol, self).__init__(handle)
+        self._clear_cache()
+
+    def _clear_cache(self):
+        """Drop the cached metadata of the symbol."""
+        # pylint: disable=assigning-non-slot
+        self._arg_names = None
+        self._output_names = None
+        self._aux_names = None
+        self._infer_cache = None
+        self._executor_cache = None
+        self._cache_version = _graph_version
+
+    def _check_cache(self):
+        """Drop the cached metadata if any graph was mutated since it was read."""
+        if self._cache_version != _graph_version:
+            self._clear_cache()
 
     def __repr__(self):
         """Get a string representation of the symbol."""
@@ -189,6 +240,7 @@ class Symbol(SymbolBase):
             self.handle = handle
         else:
             self.handle = None
+        self._clear_cache()
 
     def __call__(self, *args, **kwargs):
         """Invoke symbol as function on inputs.
@@ -224,30 +276,11 @@ class Symbol(SymbolBase):
         -------
         the resulting symbol
         """
-        name = kwargs.pop('name', None)
-
-        if name:
-            name = c_str(name)
-        if len(args) != 0 and len(kwargs) != 0:
-            raise TypeError('compose only accept input Symbols \
-                either as positional or keyword arguments, not both')
-
-        for arg in args:
-            if not isinstance(arg, Symbol):
-                raise TypeError('Compose expect `Symbol` as arguments')
-        for val in kwargs.values():
-            if not isinstance(val, Symbol):
-                raise TypeError('Compose expect `Symbol` as arguments')
-
-        num_args = len(args) + len(kwargs)
-        if len(kwargs) != 0:
-            keys = c_array(ctypes.c_char_p, [c_str(key) for key in kwargs.keys()])
-            args = c_array(SymbolHandle, [s.handle for s in kwargs.values()])
-        else:
-            keys = None
-            args = c_array(SymbolHandle, [s.handle for s in args])
-        check_call(_LIB.MXSymbolCompose(
-            self.handle, name, num_args, keys, args))
+        # the composition itself is done by SymbolBase, which calls the C API
+        # directly when the cython module is available.
+        super(Symbol, self)._compose(*args, **kwargs)
+        _bump_graph_version()
+        self._clear_cache()
 
     def __getitem__(self, index):
         if isinstance(index, string_types):
@@ -359,6 +392,11 @@ class Symbol(SymbolBase):
                 raise ValueError("Set Attr only accepts string values")
             check_call(_LIB.MXSymbolSetAttr(
                 self.handle, c_str(key), c_str(str(value))))
+        # attributes such as __shape__ take part in shape and type inference,
+        # and the node may be shared with other symbols
+        if kwargs:
+            _bump_graph_version()
+        self._clear_cache()
 
     def get_internals(self):
         """Get a new grouped symbol whose output contains all the internal outputs of this symbol.
@@ -381,11 +419,15 @@ class Symbol(SymbolBase):
         args : list of string
             List of all the arguments.
         """
-        size = ctypes.c_uint()
-        sarr = ctypes.POINTER(ctypes.c_char_p)()
-        check_call(_LIB.MXSymbolListArguments(
-            self.handle, ctypes.byref(size), ctypes.byref(sarr)))
-        return [py_str(sarr[i]) for i in range(size.value)]
+        # pylint: disable=assigning-non-slot
+        self._check_cache()
+        if self._arg_names is None:
+            size = ctypes.c_uint()
+            sarr = ctypes.POINTER(ctypes.c_char_p)()
+            check_call(_LIB.MXSymbolListArguments(
+                self.handle, ctypes.byref(size), ctypes.byref(sarr)))
+            self._arg_names = [py_str(s) for s in sarr[:size.value]]
+        return list(self._arg_names)
 
     def list_outputs(self):
         """List all outputs in the symbol.
@@ -395,11 +437,15 @@ class Symbol(SymbolBase):
         returns : list of string
             List of all the outputs.
         """
-        size = ctypes.c_uint()
-        sarr = ctypes.POINTER(ctypes.c_char_p)()
-        check_call(_LIB.MXSymbolListOutputs(
-            self.handle, ctypes.byref(size), ctypes.byref(sarr)))
-        return [py_str(sarr[i]) for i in range(size.value)]
+        # pylint: disable=assigning-non-slot
+        self._check_cache()
+        if self._output_names is None:
+            size = ctypes.c_uint()
+            sarr = ctypes.POINTER(ctypes.c_char_p)()
+            check_call(_LIB.MXSymbolListOutputs(
+                self.handle, ctypes.byref(size), ctypes.byref(sarr)))
+            self._output_names = [py_str(s) for s in sarr[:size.value]]
+        return list(self._output_names)
 
     def list_auxiliary_states(self):
         """List all auxiliary states in the symbol.
@@ -416,11 +462,15 @@ class Symbol(SymbolBase):
         A common example of auxiliary state is the moving_mean and moving_variance in BatchNorm.
         Most operators do not have Auxiliary states.
         """
-        size = ctypes.c_uint()
-        sarr = ctypes.POINTER(ctypes.c_char_p)()
-        check_call(_LIB.MXSymbolListAuxiliaryStates(
-            self.handle, ctypes.byref(size), ctypes.byref(sarr)))
-        return [py_str(sarr[i]) for i in range(size.value)]
+        # pylint: disable=assigning-non-slot
+        self._check_cache()
+        if self._aux_names is None:
+            size = ctypes.c_uint()
+            sarr = ctypes.POINTER(ctypes.c_char_p)()
+            check_call(_LIB.MXSymbolListAuxiliaryStates(
+                self.handle, ctypes.byref(size), ctypes.byref(sarr)))
+            self._aux_names = [py_str(s) for s in sarr[:size.value]]
+        return list(self._aux_names)
 
     def infer_type(self, *args, **kwargs):
         """Infer the type of outputs and arguments of given known types of arguments.
@@ -470,8 +520,14 @@ class Symbol(SymbolBase):
             for k, v in kwargs.items():
                 v = _numpy.dtype(v).type
                 if v in _DTYPE_NP_TO_MX:
-                    keys.append(c_str(k))
+                    keys.append(k)
                     sdata.append(_DTYPE_NP_TO_MX[v])
+        cache_key = ('type', None if keys is None else tuple(keys), tuple(sdata))
+        return self._cached_infer(cache_key, self._infer_type_call, keys, sdata)
+
+    def _infer_type_call(self, keys, sdata):
+        """Call the type inference API on the marshalled input types."""
+        # pylint: disable=too-many-locals
         arg_type_size = mx_uint()
         arg_type_data = ctypes.POINTER(ctypes.c_int)()
         out_type_size = mx_uint()
@@ -482,7 +538,7 @@ class Symbol(SymbolBase):
         check_call(_LIB.MXSymbolInferType(
             self.handle,
             mx_uint(len(sdata)),
-            c_array(ctypes.c_char_p, keys),
+            None if keys is None else c_str_array(keys),
             c_array(ctypes.c_int, sdata),
             ctypes.byref(arg_type_size),
             ctypes.byref(arg_type_data),
@@ -567,9 +623,36 @@ class Symbol(SymbolBase):
             keys = []
             for k, v in kwargs.items():
                 if isinstance(v, tuple):
-                    keys.append(c_str(k))
+                    keys.append(k)
                     sdata.extend(v)
                     indptr.append(len(sdata))
+        cache_key = ('shape', partial, None if keys is None else tuple(keys),
+                     tuple(indptr), tuple(sdata))
+        return self._cached_infer(cache_key, self._infer_shape_call,
+                                  partial, keys, indptr, sdata)
+
+    def _cached_infer(self, cache_key, infer_func, *args):
+        """Return the memoized result of infer_func(*args) for cache_key.
+
+        Inference results only depend on the graph and the given inputs, so
+        repeated calls with the same inputs do not go through the C API again.
+        """
+        # pylint: disable=assigning-non-slot
+        self._check_cache()
+        if self._infer_cache is None:
+            self._infer_cache = OrderedDict()
+        result = self._infer_cache.pop(cache_key, None)
+        if result is None:
+            result = infer_func(*args)
+            if len(self._infer_cache) >= _INFER_CACHE_SIZE:
+                self._infer_cache.popitem(last=False)
+        # (re-)insert to mark it as the most recently used one
+        self._infer_cache[cache_key] = result
+        return tuple(None if ret is None else list(ret) for ret in result)
+
+    def _infer_shape_call(self, partial, keys, indptr, sdata):
+        """Call the shape inference API on the marshalled input shapes."""
+        # pylint: disable=too-many-locals
         arg_shape_size = mx_uint()
         arg_shape_ndim = ctypes.POINTER(mx_uint)()
         arg_shape_data = ctypes.POINTER(ctypes.POINTER(mx_uint))()
@@ -587,7 +670,7 @@ class Symbol(SymbolBase):
         check_call(infer_func(
             self.handle,
             mx_uint(len(indptr) - 1),
-            c_array(ctypes.c_char_p, keys),
+            None if keys is None else c_str_array(keys),
             c_array(mx_uint, indptr),
             c_array(mx_uint, sdata),
             ctypes.byref(arg_shape_size),
@@ -601,12 +684,9 @@ class Symbol(SymbolBase):
             ctypes.byref(aux_shape_data),
             ctypes.byref(complete)))
         if complete.value != 0:
-            arg_shapes = [
-                tuple(arg_shape_data[i][:arg_shape_ndim[i]]) for i in range(arg_shape_size.value)]
-            out_shapes = [
-                tuple(out_shape_data[i][:out_shape_ndim[i]]) for i in range(out_shape_size.value)]
-            aux_shapes = [
-                tuple(aux_shape_data[i][:aux_shape_ndim[i]]) for i in range(aux_shape_size.value)]
+            arg_shapes = _decode_shapes(arg_shape_size.value, arg_shape_ndim, arg_shape_data)
+            out_shapes = _decode_shapes(out_shape_size.value, out_shape_ndim, out_shape_data)
+            aux_shapes = _decode_shapes(aux_shape_size.value, aux_shape_ndim, aux_shape_data)
             return (arg_shapes, out_shapes, aux_shapes)
         else:
             return (None, None, None)
@@ -699,27 +779,47 @@ class Symbol(SymbolBase):
                 arg_handles.append(narr.handle)
             arg_arrays = args
         elif isinstance(args, dict):
-            for name in arg_names:
-                if name in args:
-                    narr = args[name]
-                    if not isinstance(narr, NDArray):
-                        raise TypeError('Only Accept list of NDArrays or dict of str to NDArray')
-                    arg_handles.append(narr.handle)
-                    arg_arrays.append(narr)
-                else:
-                    if allow_missing:
-                        arg_handles.append(None)
-                        arg_arrays.append(None)
-                    else:
+            arg_handles = [None] * len(arg_names)
+            arg_arrays = [None] * len(arg_names)
+            for i, name in enumerate(arg_names):
+                narr = args.get(name)
+                if narr is None:
+                    if not allow_missing:
                         raise ValueError('key `%s` is missing in `%s`' % (name, arg_key))
+                    continue
+                if not isinstance(narr, NDArray):
+                    raise TypeError('Only Accept list of NDArrays or dict of str to NDArray')
+                arg_handles[i] = narr.handle
+                arg_arrays[i] = narr
         else:
             raise TypeError('Only Accept list of NDArrays or dict of str to NDArray')
         return c_array(NDArrayHandle, arg_handles), arg_arrays
 
+    @staticmethod
+    def _simple_bind_key(ctx, grad_req, type_dict, group2ctx, shapes):
+        """Get a hashable key of simple_bind arguments, or None if they cannot be hashed."""
+        def _items(dct):
+            return None if dct is None else tuple(sorted(dct.items()))
+        if isinstance(grad_req, dict):
+            grad_req = _items(grad_req)
+        elif isinstance(grad_req, list):
+            grad_req = tuple(grad_req)
+        if group2ctx is not None:
+            group2ctx = tuple(sorted((k, v.device_typeid, v.device_id)
+                                     for k, v in group2ctx.items()))
+        key = (ctx.device_typeid, ctx.device_id, grad_req,
+               _items(type_dict), group2ctx, _items(shapes))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     def simple_bind(self, ctx,
                     grad_req='write',
                     type_dict=None,
                     group2ctx=None,
+                    reuse_executor=False,
                     **kwargs):
         """Bind current symbol to get an executor, allocate all the ndarrays needed.
         Allows specifying data types.
@@ -746,6 +846,13 @@ class Symbol(SymbolBase):
         group2ctx : dict of string to mx.Context
             The dict mapping the ``ctx_group`` attribute to the context assignment.
 
+        reuse_executor : boolean, optional
+            When True, an executor previously created by this symbol with the same
+            arguments is returned instead of binding a new one. The returned executor
+            and its arrays are then shared by all such callers.
+            Modifying any graph invalidates the cached executors. They and their
+            arrays are kept until this symbol is next used or garbage collected.
+
         kwargs : dict of str->shape
             Input shape dictionary, name->shape
 
@@ -754,9 +861,23 @@ class Symbol(SymbolBase):
         executor : mxnet.Executor
             The generated Executor
         """
-        # pylint: disable=too-many-locals
+        # pylint: disable=too-many-locals, assigning-non-slot
+        cache_key = None
+        if reuse_executor:
+            cache_key = self._simple_bind_key(ctx, grad_req, type_dict, group2ctx, kwargs)
+        if cache_key is not None:
+            self._check_cache()
+            if self._executor_cache is None:
+                self._executor_cache = OrderedDict()
+            executor = self._executor_cache.pop(cache_key, None)
+            if executor is not None:
+                # re-insert to mark it as the most recently used one
+                self._executor_cache[cache_key] = executor
+                return executor
+
+        listed_arguments = self.list_arguments()
         if type_dict is None:
-            type_dict = {k: mx_real_t for k in self.list_arguments()}
+            type_dict = {k: mx_real_t for k in listed_arguments}
         arg_shapes, _, aux_shapes = self.infer_shape(**kwargs)
         arg_types, _, aux_types = self.infer_type(**type_dict)
 
@@ -767,7 +888,7 @@ class Symbol(SymbolBase):
             attr_dict = self.attr_dict()
             arg_ctx = [group2ctx.get(attr_dict[name]['__ctx_group__'], ctx) \
                          if name in attr_dict and '__ctx_group__' in attr_dict[name] \
-                         else ctx for name in self.list_arguments()]
+                         else ctx for name in listed_arguments]
             aux_ctx = [group2ctx.get(attr_dict[name]['__ctx_group__'], ctx) \
                          if name in attr_dict and '__ctx_group__' in attr_dict[name] \
                          else ctx for name in self.list_auxiliary_states()]
@@ -782,7 +903,7 @@ class Symbol(SymbolBase):
         if grad_req != 'null':
             grad_ndarrays = {}
             for name, shape, dev, dtype in zip(
-                    self.list_arguments(), arg_shapes, arg_ctx, arg_types):
+                    listed_arguments, arg_shapes, arg_ctx, arg_types):
                 if not isinstance(grad_req, dict) or grad_req[name] != 'null':
                     grad_ndarrays[name] = _nd_zeros(shape, dev, dtype=dtype)
         else:
@@ -793,6 +914,10 @@ class Symbol(SymbolBase):
         executor = self.bind(ctx, arg_ndarrays,
                              grad_ndarrays, grad_req, aux_ndarrays,
                              group2ctx=group2ctx)
+        if cache_key is not None:
+            if len(self._executor_cache) >= _EXECUTOR_CACHE_SIZE:
+                self._executor_cache.popitem(last=False)
+            self._executor_cache[cache_key] = executor
         return executor
 
     def bind(self, ctx, args, args_grad=None, grad_req='write',
@@ -870,7 +995,8 @@ class Symbol(SymbolBase):
         args_handle, args = self._get_ndarray_inputs('args', args, listed_arguments, False)
         # setup args gradient
         if args_grad is None:
-            args_grad_handle = c_array(NDArrayHandle, [None] * len(args))
+            # ctypes arrays are zero initialized, i.e. all NULL handles
+            args_grad_handle = (NDArrayHandle * len(args))()
         else:
             args_grad_handle, args_grad = self._get_ndarray_inputs(
                 'args_grad', args_grad, listed_arguments, True)
@@ -885,17 +1011,14 @@ class Symbol(SymbolBase):
         if isinstance(grad_req, string_types):
             if grad_req not in req_map:
                 raise ValueError('grad_req must be in %s' % str(req_map))
-            reqs_array = c_array(mx_uint, [mx_uint(req_map[grad_req])] * len(listed_arguments))
+            reqs = array.array('I', [req_map[grad_req]]) * len(listed_arguments)
         elif isinstance(grad_req, list):
-            reqs_array = c_array(mx_uint, [mx_uint(req_map[item]) for item in grad_req])
+            reqs = array.array('I', [req_map[item] for item in grad_req])
         elif isinstance(grad_req, dict):
-            req_array = []
-            for name in listed_arguments:
-                if name in grad_req:
-                    req_array.append(mx_uint(req_map[grad_req[name]]))
-                else:
-                    req_array.append(mx_uint(0))
-            reqs_array = c_array(mx_uint, req_array)
+            reqs = array.array('I', [req_map[grad_req[name]] if name in grad_req else 0
+                                     for name in listed_arguments])
+        # view the buffer directly instead of wrapping every entry in mx_uint
+        reqs_array = (mx_uint * len(reqs)).from_buffer(reqs)
 
         ctx_map_keys = []
         ctx_map_dev_types = []
@@ -903,17 +1026,18 @@ class Symbol(SymbolBase):
 
         if group2ctx:
             for key, val in group2ctx.items():
-                ctx_map_keys.append(c_str(key))
+                ctx_map_keys.append(key)
                 ctx_map_dev_types.append(ctypes.c_int(val.device_typeid))
                 ctx_map_dev_ids.append(ctypes.c_int(val.device_id))
 
         handle = ExecutorHandle()
-        shared_handle = shared_exec.handle if shared_exec is not None else ExecutorHandle()
+        # a NULL pointer does not need a fresh handle object
+        shared_handle = shared_exec.handle if shared_exec is not None else None
         check_call(_LIB.MXExecutorBindEX(self.handle,
                                          ctypes.c_int(ctx.device_typeid),
                                          ctypes.c_int(ctx.device_id),
                                          mx_uint(len(ctx_map_keys)),
-                                         c_array(ctypes.c_char_p, ctx_map_keys),
+                                         c_str_array(ctx_map_keys),
                                          c_array(ctypes.c_int, ctx_map_dev_types),
                                          c_array(ctypes.c_int, ctx_map_dev_ids),
                                          mx_uint(len(args)),
@@ -946,7 +1070,7 @@ class Symbol(SymbolBase):
             A gradient Symbol with returns to be the corresponding gradients.
         """
         handle = SymbolHandle()
-        c_wrt = c_array(ctypes.c_char_p, [c_str(key) for key in wrt])
+        c_wrt = c_str_array(wrt)
         check_call(_LIB.MXSymbolGrad(self.handle,
                                      mx_uint(len(wrt)),
                                      c_wrt,
@@ -1012,15 +1136,14 @@ def Group(symbols):
     sym : Symbol
         The created group symbol.
      """
-    ihandles = []
+    symbols = list(symbols)
     for sym in symbols:
         if not isinstance(sym, Symbol):
             raise TypeError('Expect Symbols in the list input')
-        ihandles.append(sym.handle)
     handle = SymbolHandle()
     check_call(_LIB.MXSymbolCreateGroup(
-        mx_uint(len(ihandles)),
-        c_array(SymbolHandle, ihandles), ctypes.byref(handle)))
+        mx_uint(len(symbols)),
+        c_handle_array(symbols), ctypes.byref(handle)))
     return Symbol(handle)
 
 
@@ -1,3 +1,5 @@
+import gc
+import weakref
 import numpy as np
 import mxnet as mx
 
@@ -129,6 +131,52 @@ def test_reshape():
     exe.forward(is_train=False)
     assert np.all(exe.outputs[0].asnumpy() == 4)
 
+def test_bind_none_in_dict():
+    x = mx.sym.Variable('x')
+    y = mx.sym.FullyConnected(x, num_hidden=4, name='fc')
+    args = {'x': mx.nd.zeros((5, 4)), 'fc_weight': mx.nd.zeros((4, 4)),
+            'fc_bias': mx.nd.zeros((4,))}
+    # an explicit None gradient is the same as leaving the gradient out
+    args_grad = {'x': None, 'fc_weight': mx.nd.zeros((4, 4))}
+    _, grad_arrays = mx.sym.Symbol._get_ndarray_inputs(
+        'args_grad', args_grad, y.list_arguments(), True)
+    assert grad_arrays[0] is None and grad_arrays[2] is None
+    assert grad_arrays[1] is args_grad['fc_weight']
+    exe = y.bind(mx.cpu(), args, args_grad=args_grad)
+    assert exe.grad_arrays[0] is None
+    # while a None argument is reported as missing
+    args['x'] = None
+    try:
+        y.bind(mx.cpu(), args)
+        assert False, 'bind should reject a None argument'
+    except ValueError:
+        pass
+
+def test_simple_bind_reuse():
+    x = mx.sym.Variable('x')
+    y = mx.sym.FullyConnected(x, num_hidden=4)
+    exe = y.simple_bind(mx.cpu(), x=(5, 4), reuse_executor=True)
+    assert y.simple_bind(mx.cpu(), x=(5, 4), reuse_executor=True) is exe
+    assert y.simple_bind(mx.cpu(), x=(5, 4)) is not exe
+    assert y.simple_bind(mx.cpu(), x=(6, 4), reuse_executor=True) is not exe
+    assert y.simple_bind(mx.cpu(), x=(5, 4), grad_req='null', reuse_executor=True) is not exe
+    # mutating the graph drops the cached executors, and with them their
+    # arrays, the next time the symbol is used
+    exe_ref = weakref.ref(exe)
+    del exe
+    y._set_attr(__mood__='happy')
+    exe2 = y.simple_bind(mx.cpu(), x=(5, 4), reuse_executor=True)
+    gc.collect()
+    assert exe_ref() is None
+    exe_ref = weakref.ref(exe2)
+    del exe2
+    y._compose(x=mx.sym.Variable('x'))
+    y.list_arguments()
+    gc.collect()
+    assert exe_ref() is None
+
 if __name__ == "__main__":
     test_bind()
     test_reshape()
+    test_bind_none_in_dict()
+    test_simple_bind_reuse()
@@ -1,5 +1,7 @@
 import copy
 import os
+import subprocess
+import sys
 import mxnet as mx
 import numpy as np
 from common import models
@@ -31,6 +33,15 @@ def test_symbol_compose():
     assert len(multi_out.list_outputs()) == 2
 
 
+def test_symbol_group_many():
+    "Group enough symbols to pass their handles through memmove"
+    data = mx.symbol.Variable('data')
+    fcs = [mx.symbol.FullyConnected(data=data, name='fc%d' % i, num_hidden=2)
+           for i in range(20)]
+    group = mx.symbol.Group(fcs)
+    assert group.list_outputs() == ['fc%d_output' % i for i in range(20)]
+
+
 def test_symbol_copy():
     data = mx.symbol.Variable('data')
     data_2 = copy.deepcopy(data)
@@ -39,6 +50,61 @@ def test_symbol_copy():
     assert data.tojson() == data_3.tojson()
 
 
+def test_symbol_list_cache():
+    data = mx.symbol.Variable('data')
+    net1 = mx.symbol.FullyConnected(data=data, name='fc1', num_hidden=10)
+    arg_names = net1.list_arguments()
+    arg_names.append('junk')
+    assert net1.list_arguments() == ['data', 'fc1_weight', 'fc1_bias']
+
+    net2 = mx.symbol.FullyConnected(name='fc2', num_hidden=10)
+    assert net2.list_arguments() == ['fc2_data', 'fc2_weight', 'fc2_bias']
+    net2._compose(fc2_data=net1)
+    assert net2.list_arguments() == ['data', 'fc1_weight', 'fc1_bias',
+                                     'fc2_weight', 'fc2_bias']
+
+
+def test_symbol_no_dict():
+    data = mx.symbol.Variable('data')
+    net = mx.symbol.FullyConnected(data=data, name='fc1', num_hidden=10)
+    # Symbol only uses slots, so intermediate symbols stay small
+    for sym in [data, net, net.get_internals(), copy.copy(net)]:
+        assert not hasattr(sym, '__dict__')
+
+
+def test_symbol_module_functions():
+    # operator functions may be created on first access
+    assert 'FullyConnected' in dir(mx.symbol)
+    assert mx.symbol.FullyConnected is mx.symbol.FullyConnected
+    assert mx.symbol.FullyConnected.__name__ == 'FullyConnected'
+    assert callable(mx.symbol._internal._Plus)
+
+
+def test_symbol_mixed_inputs():
+    x = mx.symbol.Variable('x')
+    w = mx.symbol.Variable('w')
+    try:
+        mx.symbol.FullyConnected(x, weight=w, num_hidden=2)
+        assert False, 'mixing positional and keyword inputs should fail'
+    except TypeError:
+        pass
+
+
+def test_symbol_compose_ctypes():
+    "Positional compose of the ctypes backend, below and above its preallocated sizes"
+    script = """
+import mxnet as mx
+assert mx.symbol.SymbolBase.__module__ == 'mxnet._ctypes.symbol'
+assert mx.symbol.zeros(shape=(2, 3)).list_arguments() == []
+for num in [1, 2, 4, 5, 16, 20]:
+    names = ['x%d' % i for i in range(num)]
+    sym = mx.symbol.Concat(*[mx.symbol.Variable(n) for n in names], dim=0)
+    assert sym.list_arguments() == names, sym.list_arguments()
+"""
+    env = dict(os.environ, MXNET_ENABLE_CYTHON='0', PYTHONPATH=os.pathsep.join(sys.path))
+    subprocess.check_call([sys.executable, '-c', script], env=env)
+
+
 def test_symbol_internal():
     data = mx.symbol.Variable('data')
     oldfc = mx.symbol.FullyConnected(data=data, name='fc1', num_hidden=10)
@@ -78,6 +144,9 @@ def test_symbol_infer_type():
     assert arg == [np.float16, np.float32, np.float32, np.float32]
     assert out == [np.float32]
     assert aux == []
+    assert mlp.infer_type(data=np.float16) == (arg, out, aux)
+    # positional types follow list_arguments, with None for unknown ones
+    assert mlp.infer_type(np.float16, None) == (arg, out, aux)
 
 def test_symbol_infer_shape():
     num_hidden = 128
@@ -109,6 +178,15 @@ def test_symbol_infer_shape():
     assert arg_shapes['x2h_weight'] == (num_hidden, num_dim)
     assert arg_shapes['h2h_weight'] == (num_hidden, num_hidden)
 
+    # repeated inference with the same shapes gives an equal, independent result
+    arg2, _, _ = out.infer_shape(data=(num_sample, num_dim), prevstate=state_shape)
+    assert arg2 == arg
+    assert arg2 is not arg
+
+    # positional shapes follow list_arguments, with None for unknown ones
+    ret = out.infer_shape((num_sample, num_dim), None, None, state_shape)
+    assert ret == (arg, out_shapes, aux_shapes)
+
 
 def test_symbol_infer_shape_var():
     "Test specifying shape information when constructing a variable"
@@ -127,6 +205,17 @@ def test_symbol_infer_shape_var():
     assert arg_shapes[1] == overwrite_shape
     assert out_shapes[0] == overwrite_shape
 
+def test_symbol_infer_shape_shared_node():
+    "Mutating a node shared with another symbol must not leave stale cached results"
+    x = mx.symbol.Variable('x')
+    y = mx.symbol.FullyConnected(x, num_hidden=4, name='fc')
+    arg_shapes, _, _ = y.infer_shape_partial()
+    assert arg_shapes[0] == ()
+    x._set_attr(__shape__='(5, 4)')
+    arg_shapes, out_shapes, _ = y.infer_shape_partial()
+    assert arg_shapes[0] == (5, 4)
+    assert out_shapes[0] == (5, 4)
+
 def check_symbol_consistency(sym1, sym2, ctx):
     assert sym1.list_arguments() == sym2.list_arguments()
     assert sym1.list_auxiliary_states() == sym2.list_auxiliary_states()
@@ -168,10 +257,17 @@ def test_load_000800():
 if __name__ == '__main__':
     test_load_000800()
     test_symbol_infer_shape_var()
+    test_symbol_infer_shape_shared_node()
     test_symbol_infer_shape()
     test_symbol_infer_type()
     test_symbol_internal()
     test_symbol_basic()
     test_symbol_compose()
+    test_symbol_group_many()
+    test_symbol_list_cache()
+    test_symbol_no_dict()
+    test_symbol_module_functions()
+    test_symbol_mixed_inputs()
+    test_symbol_compose_ctypes()
     test_symbol_saveload()
     test_symbol_pickle()